@@ -103,6 +103,21 @@ EXIT_KEY = "z"
 # Minimum number of white pixels to consider fish marker detected
 MIN_FISH_MARKER_PIXELS = 10
 
+# Only scan every Nth row of the capture when detecting (1 = every row)
+# Positions are scaled back to full-frame pixels, so 2 halves the work
+# for roughly 1px of precision - far below TRACKING_TOLERANCE
+DETECTION_ROW_STEP = 2
+
+# Horizontal slice of the capture that holds the fish/sweet spot bar, as
+# fractions of the capture width (start, end). The default region is
+# already just this bar - narrow it if your capture region is wider
+FISHING_BAR_X_RANGE = (0.0, 1.0)
+
+# Horizontal slice of the capture searched for the progress bar, as
+# fractions of the capture width (start, end). Narrow this to just the
+# bar's columns if you know where it sits - fewer pixels to check
+PROGRESS_BAR_X_RANGE = (0.6, 1.0)
+
 # Minimum number of dark pixels to consider fishing bar present
 # Real fishing has 2700+ dark pixels, set threshold high to avoid false positives
 MIN_BAR_PIXELS = 500
@@ -8,6 +8,8 @@ Saves images to debug_frames/ folder.
 import cv2
 import numpy as np
 import os
+import queue
+import threading
 import time
 from datetime import datetime
 
@@ -28,6 +30,21 @@ class DebugCapture:
         self.log_file = open(f"{output_dir}/log_{self.session_id}.csv", "w")
         self.log_file.write("frame,timestamp,fish_y,sweet_y,distance,velocity,action,is_holding\n")
 
+        # Log rows are buffered and written in batches instead of
+        # writing + flushing the file on every saved frame
+        self.log_rows = []
+        self.LOG_FLUSH_INTERVAL = 1.0  # Seconds between log writes
+        self.last_log_flush = time.time()
+
+        # PNG encoding + disk writes happen on a background thread so the
+        # control loop never waits on them. If the writer falls behind,
+        # the oldest queued frames are dropped so the newest ones survive
+        self.write_queue = queue.Queue(maxsize=32)
+        self.dropped_frames = 0
+        self.failed_frames = 0  # Frames the writer couldn't save
+        self.writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer_thread.start()
+
     def save_frame(self, frame, fish_y, sweet_y, velocity, action, is_holding):
         """
         Save a debug frame with visualization.
@@ -80,17 +97,65 @@ class DebugCapture:
         cv2.putText(debug_frame, f"VEL: {velocity:.1f}", (5, 40),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
 
-        # Save frame
+        # Hand the frame to the writer thread (drop the oldest if the queue is full)
         filename = f"{self.output_dir}/frame_{self.session_id}_{self.frame_count:05d}.png"
-        cv2.imwrite(filename, debug_frame)
+        self._queue_frame((filename, debug_frame))
 
         # Log data
+        now = time.time()
         distance = (fish_y - sweet_y) if (fish_y and sweet_y) else 0
-        self.log_file.write(f"{self.frame_count},{time.time()},{fish_y},{sweet_y},{distance},{velocity:.2f},{action},{is_holding}\n")
+        self.log_rows.append(f"{self.frame_count},{now},{fish_y},{sweet_y},{distance},{velocity:.2f},{action},{is_holding}\n")
+        if now - self.last_log_flush >= self.LOG_FLUSH_INTERVAL:
+            self._flush_log()
+
+    def _queue_frame(self, item):
+        """Queue a frame for the writer, making room by dropping the oldest one."""
+        while True:
+            try:
+                self.write_queue.put_nowait(item)
+                return
+            except queue.Full:
+                pass
+            try:
+                self.write_queue.get_nowait()
+                self.dropped_frames += 1
+            except queue.Empty:
+                pass  # Writer just took one - room to retry now
+
+    def _write_loop(self):
+        """Background thread: write queued frames to disk until told to stop."""
+        while True:
+            item = self.write_queue.get()
+            if item is None:  # Sentinel from close()
+                break
+            filename, debug_frame = item
+            try:
+                cv2.imwrite(filename, debug_frame)
+            except Exception as e:
+                # Keep the writer alive - one bad write shouldn't stop the
+                # rest. Only the first error is printed, close() sums up
+                if self.failed_frames == 0:
+                    print(f"[Debug] Failed to save {filename}: {e}")
+                self.failed_frames += 1
+
+    def _flush_log(self):
+        """Write buffered log rows to the CSV file."""
+        self.log_file.write("".join(self.log_rows))
         self.log_file.flush()
+        self.log_rows.clear()
+        self.last_log_flush = time.time()
 
     def close(self):
-        """Close log file."""
+        """Finish writing queued frames, write remaining log rows and close the log file."""
+        # Writer exits after the frames already queued. Never blocks on a
+        # full queue - the oldest frame is dropped to make room
+        self._queue_frame(None)
+        self.writer_thread.join()
+        self._flush_log()
         self.log_file.close()
         print(f"\n[Debug] Saved {self.frame_count} frames to {self.output_dir}/")
+        if self.dropped_frames:
+            print(f"[Debug] Dropped {self.dropped_frames} frames (writer couldn't keep up)")
+        if self.failed_frames:
+            print(f"[Debug] Failed to save {self.failed_frames} frames")
         print(f"[Debug] Log saved to {self.output_dir}/log_{self.session_id}.csv")
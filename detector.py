@@ -15,12 +15,240 @@ from config import (
     BLUE_BAR_COLOR,
     MIN_FISH_MARKER_PIXELS,
     MIN_BAR_PIXELS,
+    DETECTION_ROW_STEP,
+    PROGRESS_BAR_X_RANGE,
+    FISHING_BAR_X_RANGE,
     DEBUG_MODE,
     DEAD_ZONE,
     BRAKE_VELOCITY,
     GRAVITY_COMPENSATION,
 )
 
+# Color bounds as uint8 arrays, built once at import so the per-frame
+# cv2.inRange calls don't allocate fresh arrays every tick
+_WHITE_LOWER = np.array(FISH_MARKER_WHITE["lower"], dtype=np.uint8)
+_WHITE_UPPER = np.array(FISH_MARKER_WHITE["upper"], dtype=np.uint8)
+_GREEN_LOWER = np.array(FISH_MARKER_GREEN["lower"], dtype=np.uint8)
+_GREEN_UPPER = np.array(FISH_MARKER_GREEN["upper"], dtype=np.uint8)
+_PROGRESS_LOWER = np.array(PROGRESS_BAR_COLOR["lower"], dtype=np.uint8)
+_PROGRESS_UPPER = np.array(PROGRESS_BAR_COLOR["upper"], dtype=np.uint8)
+_DARK_LOWER = np.array(BAR_BACKGROUND_COLOR["lower"], dtype=np.uint8)
+_DARK_UPPER = np.array(BAR_BACKGROUND_COLOR["upper"], dtype=np.uint8)
+_BLUE_LOWER = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
+_BLUE_UPPER = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
+
+# Control constants used by decide_hold
+PREDICTION_FRAMES = 3       # How many frames ahead to predict the sweet spot (debug output)
+BIG_JUMP_THRESHOLD = 60     # Big jumps - definitely need sustained action
+MEDIUM_JUMP_THRESHOLD = 30  # Medium jumps - still too big for tapping
+
+
+def mask_row_centroid(mask, row_y):
+    """
+    Find the mean Y of the set pixels in a 0/255 mask.
+
+    Counts the pixels per row in one reduce pass and weights each row by
+    its Y (cheaper than cv2.moments, which also computes every moment up
+    to third order).
+
+    Args:
+        mask: 0/255 mask with one row per entry of row_y
+        row_y: Full-frame Y of each mask row
+
+    Returns:
+        tuple: (centroid Y or None if the mask is empty, set pixel count)
+    """
+    per_row = cv2.reduce(mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
+    pixels = int(per_row.sum())
+    if pixels == 0:
+        return None, 0
+    return int(per_row.dot(row_y)) // pixels, pixels
+
+
+def largest_sweet_spot_segment(blue_per_row, threshold, row_step=1):
+    """
+    Find the largest run of low-blue rows - the gap between the blue bars.
+
+    Rows under the threshold that are at most 5px apart count as one run,
+    so small specks of blue inside the sweet spot don't split it.
+
+    Args:
+        blue_per_row: Blue pixel count for each scanned row
+        threshold: Rows with fewer blue pixels than this are sweet spot rows
+        row_step: Rows skipped between scanned rows (DETECTION_ROW_STEP)
+
+    Returns:
+        numpy.ndarray: Y values of the rows in the largest run (empty if none)
+    """
+    # Rows that are NOT blue (sweet spot rows), as full-frame Y values
+    sweet_spot_rows = np.flatnonzero(blue_per_row < threshold) * row_step
+
+    # Find continuous segments
+    segment_breaks = np.flatnonzero(np.diff(sweet_spot_rows) > 5)
+    if len(segment_breaks) == 0:
+        # One continuous segment (or no rows at all)
+        return sweet_spot_rows
+
+    # Multiple segments - find the largest one from the break indices
+    # directly. Segment i covers sweet_spot_rows[bounds[i] + 1 : bounds[i + 1] + 1]
+    bounds = np.concatenate(([-1], segment_breaks, [len(sweet_spot_rows) - 1]))
+    largest = int(np.argmax(np.diff(bounds)))
+    return sweet_spot_rows[bounds[largest] + 1:bounds[largest + 1] + 1]
+
+
+def decide_hold(fish_y, sweet_spot_y, velocity, is_holding, fish_is_green,
+                in_dead_zone, brake_frames, pulse_counter,
+                pulse_hold_frames, pulse_release_frames):
+    """
+    Decide whether to hold the mouse from the detected positions.
+
+    Pure control step: takes plain numbers and returns the decision plus
+    the updated control state, so it never touches detector attributes.
+
+    Args:
+        fish_y: Y position of the fish marker
+        sweet_spot_y: Y position of the sweet spot
+        velocity: Smoothed sweet spot velocity (positive = moving down)
+        is_holding: Whether the mouse is currently held
+        fish_is_green: True when the fish marker is green (tracking)
+        in_dead_zone: Whether the previous frame was in the dead zone
+        brake_frames: Brake frame counter
+        pulse_counter: Position in the dead zone pulse cycle
+        pulse_hold_frames: Frames to hold per pulse cycle
+        pulse_release_frames: Frames to release per pulse cycle
+
+    Returns:
+        tuple: (should_hold, in_dead_zone, brake_frames, pulse_counter)
+    """
+    # For first few frames, be more aggressive (no velocity data yet)
+    is_warmup = abs(velocity) < 0.1
+
+    # Calculate distance and direction
+    # Apply gravity compensation - aim ABOVE the fish to counteract falling
+    # This makes the "target" position slightly above the actual fish
+    target_y = fish_y - GRAVITY_COMPENSATION
+    distance = target_y - sweet_spot_y  # Positive = target below, Negative = target above
+
+    if DEBUG_MODE:
+        # Prediction zone - anticipate where sweet spot will be (only shown
+        # in debug output, the decision below doesn't use it)
+        # Account for gravity: when released, it falls faster (add gravity factor)
+        gravity_factor = 2 if not is_holding else 0  # Extra fall speed when released
+        predicted_sweet_y = sweet_spot_y + (velocity * PREDICTION_FRAMES) + gravity_factor
+        predicted_distance = target_y - predicted_sweet_y
+        print(f"[Detector] Fish Y: {fish_y}, Target Y: {target_y}, Sweet Y: {sweet_spot_y}")
+        print(f"[Detector] Distance: {distance}, Velocity: {velocity:.1f}")
+        print(f"[Detector] Predicted distance: {predicted_distance:.1f}, Gravity comp: {GRAVITY_COMPENSATION}")
+
+    # During warmup, use smaller dead zone for faster initial response
+    active_dead_zone = 5 if is_warmup else DEAD_ZONE
+
+    # JUMP THRESHOLDS - use sustained hold/release for jumps instead of tapping
+    # This takes priority over velocity braking to catch fast-moving fish
+    if abs(distance) > MEDIUM_JUMP_THRESHOLD:
+        if distance < 0:
+            # Fish is above - HOLD to catch up
+            if DEBUG_MODE:
+                jump_type = "BIG" if abs(distance) > BIG_JUMP_THRESHOLD else "MEDIUM"
+                print(f"[Detector] {jump_type} JUMP UP: distance={distance} -> sustained HOLD")
+            return True, in_dead_zone, brake_frames, pulse_counter
+        else:
+            # Fish is below - RELEASE to fall down
+            if DEBUG_MODE:
+                jump_type = "BIG" if abs(distance) > BIG_JUMP_THRESHOLD else "MEDIUM"
+                print(f"[Detector] {jump_type} JUMP DOWN: distance={distance} -> sustained RELEASE")
+            return False, in_dead_zone, brake_frames, pulse_counter
+
+    # FIRST: Check if we need to brake due to high velocity (regardless of distance)
+    # This prevents overshoot by counter-acting momentum early
+    if not is_warmup and abs(velocity) > BRAKE_VELOCITY:
+        # Moving up fast (negative velocity) - release to brake
+        if velocity < -BRAKE_VELOCITY:
+            if DEBUG_MODE:
+                print(f"[Detector] VELOCITY BRAKE: moving up fast (v={velocity:.1f}) -> RELEASE")
+            return False, in_dead_zone, brake_frames, pulse_counter
+        # Moving down fast (positive velocity) - hold to brake
+        elif velocity > BRAKE_VELOCITY:
+            if DEBUG_MODE:
+                print(f"[Detector] VELOCITY BRAKE: falling fast (v={velocity:.1f}) -> HOLD")
+            return True, in_dead_zone, brake_frames, pulse_counter
+
+    # Smart control logic using config values
+    # If fish is above (distance negative)
+    if distance < -active_dead_zone:
+        in_dead_zone = False  # Left the dead zone
+        # Fish is above - we need to go up (hold)
+        if DEBUG_MODE:
+            print("[Detector] Fish above -> HOLD")
+        return True, in_dead_zone, brake_frames, pulse_counter
+
+    # If fish is below (distance positive)
+    elif distance > active_dead_zone:
+        in_dead_zone = False  # Left the dead zone
+        # Fish is below - we need to go down (release)
+        if DEBUG_MODE:
+            print("[Detector] Fish below -> RELEASE")
+        return False, in_dead_zone, brake_frames, pulse_counter
+
+    # In dead zone - brake first if we were moving, then pulse to maintain
+    else:
+        # FIRST: Check if fish is green (tracking) at edges - don't pulse, stay steady
+        if fish_is_green:
+            # At top edge - just hold steady instead of pulsing
+            if sweet_spot_y < 70:
+                if DEBUG_MODE:
+                    print(f"[Detector] TOP EDGE + GREEN - steady HOLD (no bounce)")
+                return True, in_dead_zone, brake_frames, pulse_counter
+            # At bottom edge - just release instead of pulsing
+            if sweet_spot_y > 250:
+                if DEBUG_MODE:
+                    print(f"[Detector] BOTTOM EDGE + GREEN - steady RELEASE (no bounce)")
+                return False, in_dead_zone, brake_frames, pulse_counter
+
+        # If fish is WHITE (not tracking) and at bottom edge, hold to recover
+        if not fish_is_green and sweet_spot_y > 250:
+            if DEBUG_MODE:
+                print(f"[Detector] BOTTOM EDGE + WHITE - HOLD to recover")
+            return True, in_dead_zone, brake_frames, pulse_counter
+
+        # Check if we just entered the dead zone
+        if not in_dead_zone:
+            in_dead_zone = True
+            brake_frames = 0
+            pulse_counter = 0
+            if DEBUG_MODE:
+                print(f"[Detector] ENTERING dead zone, velocity: {velocity:.1f}")
+
+        # If we have downward velocity (falling), brake until stopped
+        if velocity > 3:
+            if DEBUG_MODE:
+                print(f"[Detector] BRAKING - holding to stop fall (v={velocity:.1f})")
+            return True, in_dead_zone, brake_frames, pulse_counter
+
+        # If we have upward velocity (rising), brake by releasing
+        if velocity < -3:
+            if DEBUG_MODE:
+                print(f"[Detector] BRAKING - releasing to stop rise (v={velocity:.1f})")
+            return False, in_dead_zone, brake_frames, pulse_counter
+
+        # After braking (or if already slow), pulse to maintain position
+        pulse_counter += 1
+        total_cycle = pulse_hold_frames + pulse_release_frames
+
+        # Reset counter if it gets too high
+        if pulse_counter >= total_cycle:
+            pulse_counter = 0
+
+        # Hold for first part of cycle, release for second part
+        if pulse_counter < pulse_hold_frames:
+            if DEBUG_MODE:
+                print(f"[Detector] PULSE HOLD ({pulse_counter}/{pulse_hold_frames})")
+            return True, in_dead_zone, brake_frames, pulse_counter
+        else:
+            if DEBUG_MODE:
+                print(f"[Detector] PULSE RELEASE ({pulse_counter - pulse_hold_frames}/{pulse_release_frames})")
+            return False, in_dead_zone, brake_frames, pulse_counter
+
 
 class FishingDetector:
     """
@@ -60,6 +288,99 @@ class FishingDetector:
         self.brake_frames = 0
         self.BRAKE_FRAMES_NEEDED = 5  # Hold for 5 frames to brake before pulsing
 
+        # Reusable mask buffers by name - allocated on the first frame
+        self._mask_buffers = {}
+
+        # Caught check throttle - the progress bar and bar presence change on
+        # a seconds scale, so the full check only runs every Nth frame
+        self.CAUGHT_CHECK_INTERVAL = 6  # ~20 checks/sec at 120 Hz
+        self.caught_check_countdown = 0
+        self.last_caught_result = False
+
+        # Blue mask of the last frame seen - is_fishing_active and the sweet
+        # spot both need it, so it's only built once per frame
+        self._blue_mask_frame = None
+        self._blue_mask = None
+
+        # Coarse presence probe for is_fishing_active - every Nth row only.
+        # Blue bars span dozens of rows, so rows this sparse still see them
+        # (skipping columns could miss a narrow bar entirely); only a hit
+        # pays for the full check
+        self.COARSE_STEP = 8
+        self.COARSE_MIN_BLUE_PIXELS = 150  # Half the real threshold, for sampling slack
+
+        # Bar columns, sampled row positions and progress pixel estimate -
+        # set on the first frame
+        self._layout_frame_shape = None
+        self._row_y = None
+        self._bar_x0 = 0
+        self._bar_x1 = 0
+        self._progress_x0 = 0
+        self._progress_x1 = 0
+        self._progress_total_pixels = 1
+
+    def _mask_buffer(self, name, shape):
+        """
+        Get a reusable mask buffer so cv2 can write into it with dst=.
+
+        Args:
+            name: Buffer name (one buffer per mask kind)
+            shape: (height, width) of the mask
+
+        Returns:
+            numpy.ndarray: uint8 buffer of the requested shape
+        """
+        buffer = self._mask_buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.uint8)
+            self._mask_buffers[name] = buffer
+        return buffer
+
+    def _update_layout(self, frame):
+        """
+        Work out the bar and progress bar columns (and the Y of each
+        sampled row) for this frame size.
+        They only depend on the frame shape, so this is a no-op after the
+        first frame.
+
+        Args:
+            frame: BGR image from screen capture
+        """
+        if frame.shape == self._layout_frame_shape:
+            return
+
+        height, width = frame.shape[:2]
+        self._layout_frame_shape = frame.shape
+        self._bar_x0 = int(width * FISHING_BAR_X_RANGE[0])
+        self._bar_x1 = max(self._bar_x0 + 1, int(width * FISHING_BAR_X_RANGE[1]))
+        self._progress_x0 = int(width * PROGRESS_BAR_X_RANGE[0])
+        self._progress_x1 = max(self._progress_x0 + 1, int(width * PROGRESS_BAR_X_RANGE[1]))
+        self._row_y = np.arange(0, height, DETECTION_ROW_STEP)  # Full-frame Y of each sampled row
+        # Estimate total possible pixels in progress bar
+        # Rough estimate: progress bar is about 10% of width, full height
+        self._progress_total_pixels = max(1, height * (width * 0.1))
+
+    def _get_blue_mask(self, frame):
+        """
+        Get the blue bar mask for a frame, reusing it if already built.
+
+        The cache holds a reference to the frame itself (not its id), so a
+        new frame can never be mistaken for the cached one.
+
+        Args:
+            frame: BGR image from screen capture
+
+        Returns:
+            numpy.ndarray: Blue mask of every Nth row of the bar columns
+        """
+        if frame is not self._blue_mask_frame:
+            self._update_layout(frame)
+            sampled = frame[::DETECTION_ROW_STEP, self._bar_x0:self._bar_x1]
+            self._blue_mask = cv2.inRange(sampled, _BLUE_LOWER, _BLUE_UPPER,
+                                          dst=self._mask_buffer("blue", sampled.shape[:2]))
+            self._blue_mask_frame = frame
+        return self._blue_mask
+
     def reset_state(self):
         """Reset all tracking state for a new fish. Call when fishing starts."""
         self.last_fish_y = None
@@ -73,6 +394,9 @@ class FishingDetector:
         self.pulse_counter = 0
         self.in_dead_zone = False
         self.brake_frames = 0
+        # Run the caught check on the very first frame of the new fish
+        self.caught_check_countdown = 0
+        self.last_caught_result = False
         # Allow first few frames to gradually adjust toward real position
         self.warmup_frames = 10  # More frames to smoothly reach real position
 
@@ -87,25 +411,45 @@ class FishingDetector:
         Returns:
             bool: True if fishing bars are visible
         """
-        # Check for dark pixels (bar background)
-        lower_dark = np.array(BAR_BACKGROUND_COLOR["lower"], dtype=np.uint8)
-        upper_dark = np.array(BAR_BACKGROUND_COLOR["upper"], dtype=np.uint8)
-        dark_mask = cv2.inRange(frame, lower_dark, upper_dark)
-        dark_pixel_count = cv2.countNonZero(dark_mask)
+        # Only look at every Nth row (a view, no copy) - counts are scaled
+        # back up so the thresholds stay in full-frame pixels
+        step = DETECTION_ROW_STEP
+
+        # Quick probe on sparse rows first - when nothing blue shows up
+        # there (most idle frames) skip the full check entirely
+        coarse_step = self.COARSE_STEP
+        coarse = frame[::coarse_step]
+        coarse_mask = cv2.inRange(coarse, _BLUE_LOWER, _BLUE_UPPER,
+                                  dst=self._mask_buffer("coarse_blue", coarse.shape[:2]))
+        if cv2.countNonZero(coarse_mask) * coarse_step < self.COARSE_MIN_BLUE_PIXELS:
+            if DEBUG_MODE:
+                print("[Detector] No blue on coarse probe (no fishing bar)")
+            return False
 
-        # Also check for blue bar pixels (the cyan/blue sections)
-        lower_blue = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
-        upper_blue = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
-        blue_mask = cv2.inRange(frame, lower_blue, upper_blue)
-        blue_pixel_count = cv2.countNonZero(blue_mask)
+        # Check for blue bar pixels (the cyan/blue sections) first - the
+        # mask is shared with the sweet spot, and when it fails (most idle
+        # frames) the dark check below doesn't need to run at all
+        blue_mask = self._get_blue_mask(frame)
+        blue_pixel_count = cv2.countNonZero(blue_mask) * step
+
+        # Real fishing has 1400+ blue pixels, use high threshold to avoid false positives
+        if blue_pixel_count <= 300:
+            if DEBUG_MODE:
+                print(f"[Detector] Blue pixels: {blue_pixel_count} (no fishing bar)")
+            return False
+
+        # Check for dark pixels (bar background)
+        sampled = frame[::step]
+        dark_mask = cv2.inRange(sampled, _DARK_LOWER, _DARK_UPPER,
+                                dst=self._mask_buffer("dark", sampled.shape[:2]))
+        dark_pixel_count = cv2.countNonZero(dark_mask) * step
 
         if DEBUG_MODE:
             print(f"[Detector] Dark pixels: {dark_pixel_count}, Blue pixels: {blue_pixel_count}")
 
         # Fishing is active if we have BOTH dark pixels AND blue bar pixels
         # This prevents false positives from dark ocean water
-        # Real fishing has 1400+ blue pixels, use high threshold to avoid false positives
-        return dark_pixel_count > MIN_BAR_PIXELS and blue_pixel_count > 300
+        return dark_pixel_count > MIN_BAR_PIXELS
 
     def get_fish_position(self, frame):
         """
@@ -118,45 +462,45 @@ class FishingDetector:
         Returns:
             int or None: Y coordinate of fish marker, or None if not found
         """
+        # Only look at every Nth row of the bar columns (a view, no copy)
+        step = DETECTION_ROW_STEP
+        self._update_layout(frame)
+        sampled = frame[::step, self._bar_x0:self._bar_x1]
+        mask_shape = sampled.shape[:2]
+
         # Detect WHITE fish marker (not tracking)
-        lower_white = np.array(FISH_MARKER_WHITE["lower"], dtype=np.uint8)
-        upper_white = np.array(FISH_MARKER_WHITE["upper"], dtype=np.uint8)
-        white_mask = cv2.inRange(frame, lower_white, upper_white)
+        white_mask = cv2.inRange(sampled, _WHITE_LOWER, _WHITE_UPPER,
+                                 dst=self._mask_buffer("white", mask_shape))
         white_pixels = cv2.countNonZero(white_mask)
 
         # Detect GREEN fish marker (tracking correctly)
-        lower_green = np.array(FISH_MARKER_GREEN["lower"], dtype=np.uint8)
-        upper_green = np.array(FISH_MARKER_GREEN["upper"], dtype=np.uint8)
-        green_mask = cv2.inRange(frame, lower_green, upper_green)
+        green_mask = cv2.inRange(sampled, _GREEN_LOWER, _GREEN_UPPER,
+                                 dst=self._mask_buffer("green", mask_shape))
         green_pixels = cv2.countNonZero(green_mask)
 
         # Determine if fish is green (tracking) or white (not tracking)
         # Green means we're doing well, white means we need to catch up
         self.fish_is_green = green_pixels > white_pixels
 
-        # Combine both masks - fish can be either color
-        combined_mask = cv2.bitwise_or(white_mask, green_mask)
-
-        # Count fish pixels
-        fish_pixels = cv2.countNonZero(combined_mask)
+        # The white and green ranges don't overlap (green blue channel tops out
+        # below white's minimum), so the two counts already give the total -
+        # no need to count the combined mask again
+        fish_pixels = (white_pixels + green_pixels) * step  # Scale back to full-frame pixels
 
         if fish_pixels < MIN_FISH_MARKER_PIXELS:
             if DEBUG_MODE:
                 print(f"[Detector] Fish marker not found (only {fish_pixels} pixels)")
             return self.last_fish_y  # Return last known position
 
-        # Find the coordinates of fish pixels
-        coords = cv2.findNonZero(combined_mask)
-
-        if coords is None:
-            return self.last_fish_y
+        # Combine both masks in place - fish can be either color
+        combined_mask = cv2.bitwise_or(white_mask, green_mask, dst=white_mask)
 
         # Get the average Y coordinate, adjusted for fish icon center
         # White fish icon is taller than green, so needs larger offset
         # Larger offset = aim higher (more negative)
-        y_coords = coords[:, 0, 1]
         offset = -8 if self.fish_is_green else -35  # Green is shorter, white needs bigger offset
-        fish_y = int(np.mean(y_coords)) + offset
+        fish_y, _ = mask_row_centroid(combined_mask, self._row_y)
+        fish_y += offset
 
         # Update last known position
         self.last_fish_y = fish_y
@@ -181,49 +525,35 @@ class FishingDetector:
         Returns:
             int or None: Y coordinate of sweet spot center, or None if not found
         """
-        height, width = frame.shape[:2]
+        # Use the bar columns (the whole frame by default - the capture region
+        # should already be just the bar), looking at every Nth row only
+        step = DETECTION_ROW_STEP
 
-        # Use entire frame (capture region should already be just the bar)
-        bar_area = frame
+        # Detect BLUE pixels (the "not your zone" areas) - shared with
+        # is_fishing_active when both look at the same frame
+        blue_mask = self._get_blue_mask(frame)
 
-        # Detect BLUE pixels (the "not your zone" areas)
-        lower_blue = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
-        upper_blue = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
-        blue_mask = cv2.inRange(bar_area, lower_blue, upper_blue)
-
-        # Count blue pixels per row
-        blue_per_row = np.sum(blue_mask > 0, axis=1)
+        # Count blue pixels per row - mask values are 0/255, so sum each row
+        # in one OpenCV pass and scale down instead of building a bool array
+        blue_per_row = cv2.reduce(blue_mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
 
         # Find rows with LOW blue count = sweet spot area
         # Threshold: less than 20% of max blue count
-        max_blue = np.max(blue_per_row) if np.max(blue_per_row) > 0 else 1
+        max_blue = int(blue_per_row.max(initial=1))
         threshold = max_blue * 0.2
 
-        # Find rows that are NOT blue (sweet spot rows)
-        sweet_spot_rows = np.where(blue_per_row < threshold)[0]
+        # Find the center of the sweet spot
+        # Look for the largest continuous gap
+        largest_segment = largest_sweet_spot_segment(blue_per_row, threshold, step)
 
-        if len(sweet_spot_rows) == 0:
+        if len(largest_segment) == 0:
             if DEBUG_MODE:
                 print("[Detector] Sweet spot not detected (no gap in blue)")
             return self.last_sweet_spot_y
 
-        # Find the center of the sweet spot
-        # Look for the largest continuous gap
-        if len(sweet_spot_rows) > 0:
-            # Find continuous segments
-            gaps = np.diff(sweet_spot_rows)
-            segment_breaks = np.where(gaps > 5)[0]
-
-            if len(segment_breaks) == 0:
-                # One continuous segment
-                sweet_spot_y = int(np.mean(sweet_spot_rows))
-            else:
-                # Multiple segments - find the largest one
-                segments = np.split(sweet_spot_rows, segment_breaks + 1)
-                largest_segment = max(segments, key=len)
-                sweet_spot_y = int(np.mean(largest_segment))
-        else:
-            sweet_spot_y = self.last_sweet_spot_y
+        # Row indices are non-negative ints, so integer division gives
+        # the same center as int(np.mean(...)) without the float path
+        sweet_spot_y = int(largest_segment.sum()) // len(largest_segment)
 
         # Reject sweet spot detections at extreme edges (false positives from bar edges)
         # Valid range is roughly 20-280 (bar is about 300px tall) - allow near top/bottom
@@ -266,26 +596,22 @@ class FishingDetector:
         Returns:
             float: Progress from 0.0 to 1.0, or 0.0 if not detected
         """
-        # Convert color bounds to numpy arrays
-        lower = np.array(PROGRESS_BAR_COLOR["lower"], dtype=np.uint8)
-        upper = np.array(PROGRESS_BAR_COLOR["upper"], dtype=np.uint8)
+        # Progress bar columns only depend on the frame size - worked out once
+        self._update_layout(frame)
 
-        # Look at right portion of frame (where progress bar is)
-        height, width = frame.shape[:2]
-        right_portion = frame[:, int(width * 0.6):]
+        # Look at right portion of frame (where progress bar is), every Nth row
+        step = DETECTION_ROW_STEP
+        right_portion = frame[::step, self._progress_x0:self._progress_x1]
 
         # Create mask for green pixels
-        mask = cv2.inRange(right_portion, lower, upper)
-
-        # Count green pixels
-        green_pixels = cv2.countNonZero(mask)
+        mask = cv2.inRange(right_portion, _PROGRESS_LOWER, _PROGRESS_UPPER,
+                           dst=self._mask_buffer("progress", right_portion.shape[:2]))
 
-        # Estimate total possible pixels in progress bar
-        # Rough estimate: progress bar is about 10% of width, full height
-        total_bar_pixels = height * (width * 0.1)
+        # Count green pixels, scaled back to full-frame pixels
+        green_pixels = cv2.countNonZero(mask) * step
 
         # Calculate fill percentage
-        progress = min(1.0, green_pixels / max(1, total_bar_pixels))
+        progress = min(1.0, green_pixels / self._progress_total_pixels)
 
         if DEBUG_MODE:
             print(f"[Detector] Progress: {progress:.1%}")
@@ -302,16 +628,34 @@ class FishingDetector:
         Returns:
             bool: True if fish is caught
         """
-        # Check if bars are still visible
-        if not self.is_fishing_active(frame):
-            return True  # Bars gone = fish caught
+        # Only run the full check every Nth frame - reuse the last answer in between
+        if self.caught_check_countdown > 0:
+            self.caught_check_countdown -= 1
+            return self.last_caught_result
+        self.caught_check_countdown = self.CAUGHT_CHECK_INTERVAL - 1
+
+        # Check if bars are still visible (bars gone = fish caught),
+        # then check if progress bar is nearly full
+        caught = not self.is_fishing_active(frame) or self.get_progress(frame) > 0.95
+
+        self.last_caught_result = caught
+        return caught
+
+    def analyze_frame(self, frame):
+        """
+        Run the full per-frame fishing analysis: caught check, then control.
+        Both steps share the same frame, so masks built by the caught check
+        (the blue bar mask) are reused by the sweet spot detection.
 
-        # Check if progress bar is nearly full
-        progress = self.get_progress(frame)
-        if progress > 0.95:
-            return True
+        Args:
+            frame: BGR image from screen capture
 
-        return False
+        Returns:
+            tuple: (caught, should_hold) - should_hold is None when caught
+        """
+        if self.is_fish_caught(frame):
+            return True, None
+        return False, self.should_hold_mouse(frame)
 
     def should_hold_mouse(self, frame):
         """
@@ -337,8 +681,11 @@ class FishingDetector:
             self.is_holding = should_hold
             return should_hold
 
+        # Work on a local copy of the velocity and store it back once
+        velocity = self.sweet_spot_velocity
+
         # If sweet spot is stuck at reset value (150), detection is failing - TAP
-        if sweet_spot_y == 150 and abs(self.sweet_spot_velocity) < 0.5:
+        if sweet_spot_y == 150 and abs(velocity) < 0.5:
             self.pulse_counter += 1
             should_hold = (self.pulse_counter % 4) < 2  # 2 frames hold, 2 frames release
             if DEBUG_MODE:
@@ -348,161 +695,22 @@ class FishingDetector:
             return should_hold
 
         # Calculate velocity (how fast sweet spot is moving)
-        if self.prev_sweet_spot_y is not None:
-            # Smooth the velocity a bit to reduce noise
-            new_velocity = sweet_spot_y - self.prev_sweet_spot_y
-            self.sweet_spot_velocity = (self.sweet_spot_velocity * 0.5) + (new_velocity * 0.5)
+        prev_sweet_spot_y = self.prev_sweet_spot_y
+        if prev_sweet_spot_y is not None:
+            # Smooth the velocity a bit to reduce noise - an even 50/50 blend
+            # is just the average (same result as v*0.5 + new*0.5)
+            velocity = (velocity + (sweet_spot_y - prev_sweet_spot_y)) * 0.5
+            self.sweet_spot_velocity = velocity
         self.prev_sweet_spot_y = sweet_spot_y
 
-        # For first few frames, be more aggressive (no velocity data yet)
-        is_warmup = abs(self.sweet_spot_velocity) < 0.1
-
-        # Calculate distance and direction
-        # Apply gravity compensation - aim ABOVE the fish to counteract falling
-        # This makes the "target" position slightly above the actual fish
-        target_y = fish_y - GRAVITY_COMPENSATION
-        distance = target_y - sweet_spot_y  # Positive = target below, Negative = target above
-
-        # Prediction zone - anticipate where sweet spot will be
-        # Account for gravity: when released, it falls faster (add gravity factor)
-        PREDICTION_FRAMES = 3
-        gravity_factor = 2 if not self.is_holding else 0  # Extra fall speed when released
-        predicted_sweet_y = sweet_spot_y + (self.sweet_spot_velocity * PREDICTION_FRAMES) + gravity_factor
-        predicted_distance = target_y - predicted_sweet_y
-
-        if DEBUG_MODE:
-            print(f"[Detector] Fish Y: {fish_y}, Target Y: {target_y}, Sweet Y: {sweet_spot_y}")
-            print(f"[Detector] Distance: {distance}, Velocity: {self.sweet_spot_velocity:.1f}")
-            print(f"[Detector] Predicted distance: {predicted_distance:.1f}, Gravity comp: {GRAVITY_COMPENSATION}")
-
-        # During warmup, use smaller dead zone for faster initial response
-        active_dead_zone = 5 if is_warmup else DEAD_ZONE
-
-        # JUMP THRESHOLDS - use sustained hold/release for jumps instead of tapping
-        # This takes priority over velocity braking to catch fast-moving fish
-        BIG_JUMP_THRESHOLD = 60    # Big jumps - definitely need sustained action
-        MEDIUM_JUMP_THRESHOLD = 30  # Medium jumps - still too big for tapping
-
-        if abs(distance) > MEDIUM_JUMP_THRESHOLD:
-            if distance < 0:
-                # Fish is above - HOLD to catch up
-                if DEBUG_MODE:
-                    jump_type = "BIG" if abs(distance) > BIG_JUMP_THRESHOLD else "MEDIUM"
-                    print(f"[Detector] {jump_type} JUMP UP: distance={distance} -> sustained HOLD")
-                self.is_holding = True
-                return True
-            else:
-                # Fish is below - RELEASE to fall down
-                if DEBUG_MODE:
-                    jump_type = "BIG" if abs(distance) > BIG_JUMP_THRESHOLD else "MEDIUM"
-                    print(f"[Detector] {jump_type} JUMP DOWN: distance={distance} -> sustained RELEASE")
-                self.is_holding = False
-                return False
-
-        # Calculate proportional brake distance - brake earlier when moving faster
-        # This prevents overshoot by starting counter-action before reaching target
-        brake_distance = abs(self.sweet_spot_velocity) * 2.5  # Higher multiplier = earlier braking
-
-        # FIRST: Check if we need to brake due to high velocity (regardless of distance)
-        # This prevents overshoot by counter-acting momentum early
-        if not is_warmup and abs(self.sweet_spot_velocity) > BRAKE_VELOCITY:
-            # Moving up fast (negative velocity) - release to brake
-            if self.sweet_spot_velocity < -BRAKE_VELOCITY:
-                if DEBUG_MODE:
-                    print(f"[Detector] VELOCITY BRAKE: moving up fast (v={self.sweet_spot_velocity:.1f}) -> RELEASE")
-                self.is_holding = False
-                return False
-            # Moving down fast (positive velocity) - hold to brake
-            elif self.sweet_spot_velocity > BRAKE_VELOCITY:
-                if DEBUG_MODE:
-                    print(f"[Detector] VELOCITY BRAKE: falling fast (v={self.sweet_spot_velocity:.1f}) -> HOLD")
-                self.is_holding = True
-                return True
-
-        # Smart control logic using config values
-        # If fish is above (distance negative)
-        if distance < -active_dead_zone:
-            self.in_dead_zone = False  # Left the dead zone
-            # Fish is above - we need to go up (hold)
-            if DEBUG_MODE:
-                print("[Detector] Fish above -> HOLD")
-            self.is_holding = True
-            return True
-
-        # If fish is below (distance positive)
-        elif distance > active_dead_zone:
-            self.in_dead_zone = False  # Left the dead zone
-            # Fish is below - we need to go down (release)
-            if DEBUG_MODE:
-                print("[Detector] Fish below -> RELEASE")
-            self.is_holding = False
-            return False
-
-        # In dead zone - brake first if we were moving, then pulse to maintain
-        else:
-            # FIRST: Check if fish is green (tracking) at edges - don't pulse, stay steady
-            if self.fish_is_green:
-                # At top edge - just hold steady instead of pulsing
-                if sweet_spot_y < 70:
-                    if DEBUG_MODE:
-                        print(f"[Detector] TOP EDGE + GREEN - steady HOLD (no bounce)")
-                    self.is_holding = True
-                    return True
-                # At bottom edge - just release instead of pulsing
-                if sweet_spot_y > 250:
-                    if DEBUG_MODE:
-                        print(f"[Detector] BOTTOM EDGE + GREEN - steady RELEASE (no bounce)")
-                    self.is_holding = False
-                    return False
-
-            # If fish is WHITE (not tracking) and at bottom edge, hold to recover
-            if not self.fish_is_green and sweet_spot_y > 250:
-                if DEBUG_MODE:
-                    print(f"[Detector] BOTTOM EDGE + WHITE - HOLD to recover")
-                self.is_holding = True
-                return True
-
-            # Check if we just entered the dead zone
-            if not self.in_dead_zone:
-                self.in_dead_zone = True
-                self.brake_frames = 0
-                self.pulse_counter = 0
-                if DEBUG_MODE:
-                    print(f"[Detector] ENTERING dead zone, velocity: {self.sweet_spot_velocity:.1f}")
-
-            # If we have downward velocity (falling), brake until stopped
-            if self.sweet_spot_velocity > 3:
-                if DEBUG_MODE:
-                    print(f"[Detector] BRAKING - holding to stop fall (v={self.sweet_spot_velocity:.1f})")
-                self.is_holding = True
-                return True
-
-            # If we have upward velocity (rising), brake by releasing
-            if self.sweet_spot_velocity < -3:
-                if DEBUG_MODE:
-                    print(f"[Detector] BRAKING - releasing to stop rise (v={self.sweet_spot_velocity:.1f})")
-                self.is_holding = False
-                return False
-
-            # After braking (or if already slow), pulse to maintain position
-            self.pulse_counter += 1
-            total_cycle = self.PULSE_HOLD_FRAMES + self.PULSE_RELEASE_FRAMES
-
-            # Reset counter if it gets too high
-            if self.pulse_counter >= total_cycle:
-                self.pulse_counter = 0
-
-            # Hold for first part of cycle, release for second part
-            if self.pulse_counter < self.PULSE_HOLD_FRAMES:
-                if DEBUG_MODE:
-                    print(f"[Detector] PULSE HOLD ({self.pulse_counter}/{self.PULSE_HOLD_FRAMES})")
-                self.is_holding = True
-                return True
-            else:
-                if DEBUG_MODE:
-                    print(f"[Detector] PULSE RELEASE ({self.pulse_counter - self.PULSE_HOLD_FRAMES}/{self.PULSE_RELEASE_FRAMES})")
-                self.is_holding = False
-                return False
+        # Run the control step on plain numbers and store the new state
+        should_hold, self.in_dead_zone, self.brake_frames, self.pulse_counter = decide_hold(
+            fish_y, sweet_spot_y, velocity, self.is_holding, self.fish_is_green,
+            self.in_dead_zone, self.brake_frames, self.pulse_counter,
+            self.PULSE_HOLD_FRAMES, self.PULSE_RELEASE_FRAMES,
+        )
+        self.is_holding = should_hold
+        return should_hold
 
 
 # Quick test if run directly
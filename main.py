@@ -14,9 +14,12 @@ Usage:
     4. Press F6 again to pause, F7 to exit
 """
 
+import ctypes
+import threading
 import time
 import keyboard
 import cv2
+import numpy as np
 import sys
 from enum import Enum
 from colorama import init, Fore, Style
@@ -44,8 +47,9 @@ from overlay import FishingOverlay
 
 # Set up logging to file when DEBUG_MODE is on
 if DEBUG_MODE:
-    # Clear old log and set up new one
-    log_file = open('debug.log', 'w')
+    # Clear old log and set up new one. Line buffered: each finished line
+    # is written out once, instead of flushing on every write() call
+    log_file = open('debug.log', 'w', buffering=1)
 
     class TeeOutput:
         """Write to both console and file."""
@@ -55,7 +59,6 @@ if DEBUG_MODE:
         def write(self, data):
             self.stream.write(data)
             self.file.write(data)
-            self.file.flush()
         def flush(self):
             self.stream.flush()
             self.file.flush()
@@ -64,6 +67,10 @@ if DEBUG_MODE:
     print("[Debug] Logging to debug.log")
 
 
+# Windows process priority class (SetPriorityClass)
+ABOVE_NORMAL_PRIORITY_CLASS = 0x00008000
+
+
 class FishingState(Enum):
     """States for the fishing state machine."""
     IDLE = "idle"           # Waiting for fish to bite / ready to cast
@@ -86,18 +93,46 @@ class FishingMacro:
 
         # Debug capture (if enabled)
         self.debug_capture = DebugCapture() if SAVE_DEBUG_SCREENSHOTS else None
+        self.debug_display = None  # Reused scaled-up frame for the debug window
+        self.debug_action_labels = None  # Pre-rendered HOLD/RELEASE/??? labels
+        self.DEBUG_WINDOW_INTERVAL = 0.033  # Refresh the debug window at ~30 FPS max
+        self.next_debug_show = 0.0
 
         # Visual overlay on top of game
         self.overlay = FishingOverlay(CAPTURE_REGION)
 
-        self.enabled = False
+        # Windows: ask for 1ms timer resolution so the capture thread's short
+        # sleeps aren't rounded up to the default ~15.6ms tick, and run above
+        # normal priority so background apps don't delay reacting to a bite
+        if sys.platform == "win32":
+            ctypes.windll.winmm.timeBeginPeriod(1)
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetPriorityClass(kernel32.GetCurrentProcess(), ABOVE_NORMAL_PRIORITY_CLASS)
+
+        self.enabled = False  # Flipped by the toggle hotkey
+        self.active = False  # Enabled state the main loop has applied (see _apply_toggle)
         self.running = True
+        # Set by the hotkeys to wake the paused main loop - it waits on this
+        # instead of waking up every LOOP_DELAY
+        self.run_event = threading.Event()
+        self.PAUSED_WAIT = 0.25  # Max time between overlay pumps while paused
         self.state = FishingState.IDLE
         self.is_holding = False  # Track current mouse state
         self.idle_start_time = None  # Track when we started waiting for fish
         self.consecutive_idle_recasts = 0  # Track idle recasts (for out of bait detection)
         self.NO_BAIT_THRESHOLD = 7  # After this many idle recasts, assume out of bait
 
+        # State machine handlers - one dict lookup per tick instead of an
+        # if/elif chain of Enum comparisons. The debug settings can't change
+        # while running, so pick the FISHING handler once: the plain one
+        # skips the debug checks entirely
+        debug_output = self.debug_capture is not None or SHOW_DEBUG_WINDOW
+        self.state_handlers = {
+            FishingState.IDLE: self._handle_idle,
+            FishingState.FISHING: self._handle_fishing_debug if debug_output else self._handle_fishing,
+            FishingState.CAUGHT: self._handle_caught,
+        }
+
         # Set up hotkeys
         keyboard.on_press_key(TOGGLE_KEY, self._on_toggle)
         keyboard.on_press_key(EXIT_KEY, self._on_exit)
@@ -121,15 +156,32 @@ class FishingMacro:
 
     def _on_toggle(self, event):
         """Handle toggle hotkey press."""
+        # Runs on the keyboard hook thread - only flip the flag and wake the
+        # main loop, which applies it between ticks (_apply_toggle)
         self.enabled = not self.enabled
         status = "RUNNING" if self.enabled else "PAUSED"
         print(f"\n[Macro] {status}")
+        self.run_event.set()
+
+    def _apply_toggle(self, enabled):
+        """
+        Start or stop the macro on the main thread, between ticks, so the
+        mouse can't be pressed again by a tick still in flight after the
+        button was released.
+
+        Args:
+            enabled: True to start running, False to pause
+        """
+        self.active = enabled
 
         # Reset state when toggling
-        if self.enabled:
+        if enabled:
             self.state = FishingState.IDLE
             self.idle_start_time = time.time()  # Start idle timer
+            # Grab frames in the background while running
+            self.capture.start_stream(LOOP_DELAY)
         else:
+            self.capture.stop_stream()
             self.mouse.cleanup()
             self.overlay.update(is_active=False, status="OFF")
 
@@ -138,34 +190,45 @@ class FishingMacro:
         print("\n[Macro] Exiting...")
         self.running = False
         self.enabled = False
+        self.run_event.set()  # Wake the main loop so it can exit
 
     def run(self):
         """Main loop - run the macro."""
         try:
+            frame_version = 0
             while self.running:
-                if self.enabled:
-                    self._tick()
-                time.sleep(LOOP_DELAY)
+                # Apply a toggle hotkey press before the next tick
+                enabled = self.enabled
+                if enabled != self.active:
+                    self._apply_toggle(enabled)
+
+                # Redraw the overlay and handle its window events (throttled
+                # inside pump, so this is cheap on most iterations)
+                self.overlay.pump()
+
+                if self.active:
+                    # Wait for the next streamed frame - the capture thread
+                    # paces the loop, so no extra sleep is needed here
+                    frame, frame_version = self.capture.grab_latest(frame_version)
+                    if frame is not None:
+                        self._tick(frame)
+                else:
+                    # Paused - block until toggled on or exiting. The overlay
+                    # is static while paused, so only wake up every
+                    # PAUSED_WAIT to let its window handle events (and keep
+                    # Ctrl+C responsive - Windows can't interrupt an untimed wait)
+                    if self.run_event.wait(self.PAUSED_WAIT):
+                        self.run_event.clear()
 
         except KeyboardInterrupt:
             print("\n[Macro] Interrupted by user")
         finally:
             self._cleanup()
 
-    def _tick(self):
-        """Single tick of the macro logic."""
-        # Capture screen
-        frame = self.capture.grab()
-
+    def _tick(self, frame):
+        """Single tick of the macro logic on the latest captured frame."""
         # State machine
-        if self.state == FishingState.IDLE:
-            self._handle_idle(frame)
-
-        elif self.state == FishingState.FISHING:
-            self._handle_fishing(frame)
-
-        elif self.state == FishingState.CAUGHT:
-            self._handle_caught(frame)
+        self.state_handlers[self.state](frame)
 
     def _handle_idle(self, frame):
         """Handle IDLE state - waiting for fish."""
@@ -206,24 +269,34 @@ class FishingMacro:
                 print("[State] Waiting for fish...")
 
     def _handle_fishing(self, frame):
-        """Handle FISHING state - actively tracking."""
-        # Check if fish was caught
-        if self.detector.is_fish_caught(frame):
+        """
+        Handle FISHING state - actively tracking.
+
+        Returns:
+            bool or None: The hold decision for this frame (None if the
+                          fish was caught or it couldn't be determined)
+        """
+        # Check if fish was caught and determine if we should hold or
+        # release, in one pass over the frame
+        caught, should_hold = self.detector.analyze_frame(frame)
+
+        if caught:
             print("[State] Fish caught! -> CAUGHT")
             self.mouse.release()  # Make sure we release
             self.is_holding = False
             self.state = FishingState.CAUGHT
-            return
-
-        # Determine if we should hold or release
-        should_hold = self.detector.should_hold_mouse(frame)
-
-        if should_hold is True:
-            self.mouse.hold()
-            self.is_holding = True
-        elif should_hold is False:
-            self.mouse.release()
-            self.is_holding = False
+            return None
+
+        # Only call into the mouse controller when the button state actually
+        # changes - most ticks keep holding (or releasing). Checks the
+        # controller's own flag, which toggling/clicking elsewhere keeps exact
+        if should_hold is not None:
+            if should_hold != self.mouse.is_holding:
+                if should_hold:
+                    self.mouse.hold()
+                else:
+                    self.mouse.release()
+            self.is_holding = should_hold
         # If None, keep current state (couldn't determine)
 
         # Update overlay with current state
@@ -238,6 +311,14 @@ class FishingMacro:
             action=action
         )
 
+        return should_hold
+
+    def _handle_fishing_debug(self, frame):
+        """Handle FISHING state, then save/show the debug output for the frame."""
+        should_hold = self._handle_fishing(frame)
+        if self.state != FishingState.FISHING:
+            return  # Fish caught this frame - nothing to show
+
         # Save debug frame if enabled
         if self.debug_capture:
             fish_y = self.detector.last_fish_y
@@ -252,8 +333,19 @@ class FishingMacro:
 
     def _show_debug_window(self, frame, should_hold):
         """Show live debug window with detection overlay."""
-        # Make a copy and scale it up for visibility
-        display = cv2.resize(frame, (frame.shape[1] * 4, frame.shape[0] * 2))
+        # Nobody can watch faster than ~30 FPS - skip the drawing and the
+        # HighGUI event pump (waitKey) on the ticks in between
+        now = time.perf_counter()
+        if now < self.next_debug_show:
+            return
+        self.next_debug_show = now + self.DEBUG_WINDOW_INTERVAL
+
+        # Scale it up for visibility into the buffer from the last call
+        # (OpenCV only allocates a new one if the size changed). Nearest
+        # neighbour keeps the pixels crisp and is cheaper than bilinear
+        display = cv2.resize(frame, (frame.shape[1] * 4, frame.shape[0] * 2),
+                             dst=self.debug_display, interpolation=cv2.INTER_NEAREST)
+        self.debug_display = display
 
         fish_y = self.detector.last_fish_y
         sweet_y = self.detector.last_sweet_spot_y
@@ -276,10 +368,14 @@ class FishingMacro:
             cv2.putText(display, f"Sweet: {sweet_y}", (5, scaled_sweet_y + 15),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 100, 0), 1)
 
-        # Draw action indicator
-        action_text = "HOLD" if should_hold else "RELEASE" if should_hold is False else "???"
-        action_color = (0, 255, 0) if should_hold else (0, 0, 255)
-        cv2.putText(display, action_text, (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, action_color, 2)
+        # Draw action indicator - stamp the pre-rendered label instead of
+        # rasterizing the same text every frame
+        if self.debug_action_labels is None:
+            self.debug_action_labels = self._build_action_labels()
+        label_mask, label_color = self.debug_action_labels[should_hold]
+        h = min(label_mask.shape[0], display.shape[0])
+        w = min(label_mask.shape[1], display.shape[1])
+        cv2.copyTo(label_color[:h, :w], label_mask[:h, :w], display[:h, :w])
 
         # Draw distance if both positions known
         if fish_y is not None and sweet_y is not None:
@@ -290,13 +386,32 @@ class FishingMacro:
         cv2.imshow("GPO Fishing Debug", display)
         cv2.waitKey(1)  # Required to update window
 
+    def _build_action_labels(self):
+        """
+        Render the debug window's action labels once.
+
+        Returns:
+            dict: should_hold (True/False/None) -> (text mask, solid color image)
+        """
+        labels = {}
+        for should_hold, text in ((True, "HOLD"), (False, "RELEASE"), (None, "???")):
+            color = (0, 255, 0) if should_hold else (0, 0, 255)
+            (text_w, text_h), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)
+            size = (20 + baseline + 2, 5 + text_w + 2)  # Text drawn at (5, 20), plus stroke
+            mask = np.zeros(size, dtype=np.uint8)
+            cv2.putText(mask, text, (5, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.6, 255, 2)
+            labels[should_hold] = (mask, np.full(size + (3,), color, dtype=np.uint8))
+        return labels
+
     def _handle_caught(self, frame):
         """Handle CAUGHT state - recast and return to idle."""
         self.overlay.update(is_active=False, status="CAUGHT")
         print("[State] Recasting...")
 
         # Wait a moment
-        time.sleep(RECAST_DELAY)
+        self._sleep(RECAST_DELAY)
+        if not self.enabled:
+            return  # Paused during the wait - don't click after the pause
 
         # Click to recast
         self.mouse.click()
@@ -319,24 +434,41 @@ class FishingMacro:
             # Pick a random direction
             key = random.choice(movements)
             keyboard.press(key)
-            time.sleep(0.2)
+            self._sleep(0.2)
             keyboard.release(key)
-            time.sleep(0.1)
+            self._sleep(0.1)
 
         # Jump
         keyboard.press('space')
-        time.sleep(0.1)
+        self._sleep(0.1)
         keyboard.release('space')
-        time.sleep(0.3)
+        self._sleep(0.3)
 
         # One more movement
         key = random.choice(movements)
         keyboard.press(key)
-        time.sleep(0.15)
+        self._sleep(0.15)
         keyboard.release(key)
 
         print("[State] Anti-AFK complete, resuming idle...")
 
+    def _sleep(self, seconds):
+        """
+        Wait without freezing the overlay - its Tk window lives on this
+        thread, so a plain time.sleep would leave it unpainted (and "Not
+        Responding" on Windows) for the whole wait.
+
+        Args:
+            seconds: How long to wait
+        """
+        deadline = time.perf_counter() + seconds
+        while True:
+            self.overlay.pump()
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.overlay.REDRAW_INTERVAL))
+
     def _cleanup(self):
         """Clean up resources."""
         print("[Macro] Cleaning up...")
@@ -348,6 +480,8 @@ class FishingMacro:
         if SHOW_DEBUG_WINDOW:
             cv2.destroyAllWindows()
         keyboard.unhook_all()
+        if sys.platform == "win32":
+            ctypes.windll.winmm.timeEndPeriod(1)  # Undo timeBeginPeriod from __init__
         if DEBUG_MODE:
             print("[Macro] Debug log saved to: debug.log")
         print("[Macro] Goodbye!")
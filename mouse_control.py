@@ -2,13 +2,65 @@
 GPO Fishing Macro - Mouse Control Module
 =========================================
 Handles mouse automation (click, hold, release).
-Uses pynput for reliable mouse control.
+Uses pynput for reliable mouse control, with direct SendInput calls for
+the button presses on Windows.
 """
 
 from pynput.mouse import Button, Controller
+import ctypes
+import sys
 import time
 
 
+# On Windows, press/release the left button with one prebuilt SendInput
+# call each - the same input pynput sends, without its layers of Python
+# in between. Other platforms go through pynput.
+if sys.platform == "win32":
+    INPUT_MOUSE = 0
+    MOUSEEVENTF_LEFTDOWN = 0x0002
+    MOUSEEVENTF_LEFTUP = 0x0004
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", ctypes.c_long),
+            ("dy", ctypes.c_long),
+            ("mouseData", ctypes.c_ulong),
+            ("dwFlags", ctypes.c_ulong),
+            ("time", ctypes.c_ulong),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class INPUT(ctypes.Structure):
+        # MOUSEINPUT is the largest member of the Win32 INPUT union,
+        # so this has the same size and layout as the real struct
+        _fields_ = [("type", ctypes.c_ulong), ("mi", MOUSEINPUT)]
+
+    # Private user32 handle - ctypes.windll.user32.SendInput is one shared
+    # function object that pynput also calls with its own INPUT type, so
+    # setting argtypes on it would break pynput's mouse/keyboard Controllers
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _send_input = _user32.SendInput
+    _send_input.argtypes = (ctypes.c_uint, ctypes.POINTER(INPUT), ctypes.c_int)
+    _send_input.restype = ctypes.c_uint
+
+    _LEFT_DOWN = INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=MOUSEEVENTF_LEFTDOWN))
+    _LEFT_UP = INPUT(type=INPUT_MOUSE, mi=MOUSEINPUT(dwFlags=MOUSEEVENTF_LEFTUP))
+    _INPUT_SIZE = ctypes.sizeof(INPUT)
+
+    def _left_down():
+        """Press the left button. Returns False if the input was blocked."""
+        # SendInput returns the number of inputs sent - 0 when UIPI blocks
+        # it (e.g. the game runs elevated and the macro doesn't)
+        return _send_input(1, ctypes.byref(_LEFT_DOWN), _INPUT_SIZE) == 1
+
+    def _left_up():
+        """Release the left button. Returns False if the input was blocked."""
+        return _send_input(1, ctypes.byref(_LEFT_UP), _INPUT_SIZE) == 1
+else:
+    _left_down = None
+    _left_up = None
+
+
 class MouseController:
     """
     Controls mouse actions for the fishing macro.
@@ -23,6 +75,22 @@ class MouseController:
         """Initialize the mouse controller."""
         self.mouse = Controller()
         self.is_holding = False
+        self.warned_blocked = False  # Blocked-input warning is printed once
+
+        # Left button press/release - direct SendInput where available.
+        # Both return True if the input was sent
+        self.press_left = _left_down or self._pynput_press
+        self.release_left = _left_up or self._pynput_release
+
+    def _pynput_press(self):
+        """Press the left button through pynput."""
+        self.mouse.press(Button.left)
+        return True
+
+    def _pynput_release(self):
+        """Release the left button through pynput."""
+        self.mouse.release(Button.left)
+        return True
 
     def hold(self):
         """
@@ -30,8 +98,11 @@ class MouseController:
         Call this when the fish is above the sweet spot.
         """
         if not self.is_holding:
-            self.mouse.press(Button.left)
-            self.is_holding = True
+            # Only count as holding if the press actually went through
+            self.is_holding = self.press_left()
+            if not self.is_holding and not self.warned_blocked:
+                self.warned_blocked = True
+                print("[Mouse] Input blocked by Windows - try running as Administrator")
 
     def release(self):
         """
@@ -39,7 +110,7 @@ class MouseController:
         Call this when the fish is below the sweet spot.
         """
         if self.is_holding:
-            self.mouse.release(Button.left)
+            self.release_left()
             self.is_holding = False
 
     def click(self, delay=0.05):
@@ -53,9 +124,9 @@ class MouseController:
         # Make sure we're not holding before clicking
         self.release()
 
-        self.mouse.press(Button.left)
+        self.press_left()
         time.sleep(delay)
-        self.mouse.release(Button.left)
+        self.release_left()
 
     def get_position(self):
         """
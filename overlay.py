@@ -5,33 +5,31 @@ Transparent overlay that sits ON TOP of the game showing detection lines.
 """
 
 import tkinter as tk
-import threading
+import time
 
 
 class FishingOverlay:
     """
     Transparent overlay directly over the capture region.
     Shows fish and sweet spot lines on top of the game.
+
+    The window lives on the thread that creates it - call pump() from
+    that thread's loop to redraw it and keep it responsive.
     """
 
     def __init__(self, region):
         self.region = region
-        self.fish_y = None
-        self.sweet_y = None
-        self.is_active = False
+        # Latest drawn state as one tuple: (fish_y, sweet_y, is_active, action).
+        # update() swaps in a whole new tuple, so a redraw never sees a
+        # half-updated mix of old and new values. The status text isn't
+        # drawn, so it's kept apart and changing it doesn't force a redraw
+        self.state = (None, None, False, None)
         self.status = "OFF"
-        self.action = None
-        self.running = True
-
-        # Start overlay in background thread
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
 
-        import time
-        time.sleep(0.2)
+        # Redraw throttle - pump() does nothing until the next redraw is due
+        self.REDRAW_INTERVAL = 0.033  # ~30 redraws/sec
+        self.next_redraw = 0.0
 
-    def _run(self):
-        """Run the overlay window."""
         self.root = tk.Tk()
         self.root.title("")
 
@@ -56,63 +54,92 @@ class FishingOverlay:
         self.canvas = tk.Canvas(self.root, width=w, height=h, bg=self.trans_color, highlightthickness=2, highlightbackground='#ff0000')
         self.canvas.pack()
 
-        self._draw()
-        self.root.mainloop()
+        # Create every canvas item once (hidden) - redraws just move and
+        # show/hide them instead of deleting and recreating the whole scene.
+        # Creation order sets stacking order, same as the old redraw order
+        orange = '#ff8800'
+        self.sweet_zone_id = self.canvas.create_rectangle(0, 0, 0, 0, fill='', outline=orange, width=1, tags="sweet")
+        self.sweet_line_id = self.canvas.create_line(0, 0, 0, 0, fill=orange, width=2, tags="sweet")
+        self.sweet_label_id = self.canvas.create_text(0, 0, text="S", font=('Arial', 8, 'bold'), fill=orange, anchor='e', tags="sweet")
+        self.fish_line_id = self.canvas.create_line(0, 0, 0, 0, fill='#00ff00', width=3, tags="fish")
+        self.fish_label_id = self.canvas.create_text(0, 0, text="F", font=('Arial', 8, 'bold'), fill='#00ff00', anchor='e', tags="fish")
+        self.action_rect_id = self.canvas.create_rectangle(2, h-18, w-2, h-2, fill='', outline='', tags="action")
+        self.action_text_id = self.canvas.create_text(w//2, h-10, text="", font=('Arial', 8, 'bold'), fill='#ffffff', tags="action")
+        self.canvas.itemconfigure("all", state='hidden')
+
+        # State last drawn - the canvas is only touched when this changes
+        self.drawn_state = None
+
+        self.pump()
+
+    def pump(self):
+        """
+        Redraw the overlay if the state changed and process window events.
+        Cheap to call every loop iteration - it only does work every
+        REDRAW_INTERVAL seconds.
+        """
+        if self.root is None:
+            return
 
-    def _draw(self):
-        """Redraw the overlay."""
-        if not self.running:
-            self.root.destroy()
+        now = time.perf_counter()
+        if now < self.next_redraw:
             return
+        self.next_redraw = now + self.REDRAW_INTERVAL
+
+        state = self.state  # Read once - update() may replace it at any time
+        if state != self.drawn_state:
+            self.drawn_state = state
+            self._render(*state)
 
-        self.canvas.delete("all")
+        self.root.update()
 
-        w, h = self.w, self.h
+    def _render(self, fish_y, sweet_y, is_active, action):
+        """Move, show and hide the canvas items to match the given state."""
+        w = self.w
 
         # Border color based on state
-        if self.is_active:
+        if is_active:
             self.canvas.config(highlightbackground='#00ff00')
         else:
             self.canvas.config(highlightbackground='#ff0000')
 
-        # Draw sweet spot line (orange) with zone
-        if self.sweet_y is not None:
-            # Sweet spot zone (semi-transparent box)
+        # Sweet spot line (orange) with zone
+        if sweet_y is not None:
             zone_h = 30
-            self.canvas.create_rectangle(
-                0, self.sweet_y - zone_h//2,
-                w, self.sweet_y + zone_h//2,
-                fill='', outline='#ff8800', width=1
-            )
-            # Center line
-            self.canvas.create_line(0, self.sweet_y, w, self.sweet_y, fill='#ff8800', width=2)
-            # Label
-            self.canvas.create_text(w-3, self.sweet_y-8, text="S", font=('Arial', 8, 'bold'), fill='#ff8800', anchor='e')
-
-        # Draw fish marker (green line)
-        if self.fish_y is not None and self.is_active:
-            self.canvas.create_line(0, self.fish_y, w, self.fish_y, fill='#00ff00', width=3)
-            # Small label
-            self.canvas.create_text(w-3, self.fish_y+10, text="F", font=('Arial', 8, 'bold'), fill='#00ff00', anchor='e')
+            self.canvas.coords(self.sweet_zone_id, 0, sweet_y - zone_h//2, w, sweet_y + zone_h//2)
+            self.canvas.coords(self.sweet_line_id, 0, sweet_y, w, sweet_y)
+            self.canvas.coords(self.sweet_label_id, w-3, sweet_y-8)
+            self.canvas.itemconfigure("sweet", state='normal')
+        else:
+            self.canvas.itemconfigure("sweet", state='hidden')
 
-        # Action indicator at bottom
-        if self.action == "HOLD":
-            self.canvas.create_rectangle(2, h-18, w-2, h-2, fill='#00aa00', outline='')
-            self.canvas.create_text(w//2, h-10, text="HOLD", font=('Arial', 8, 'bold'), fill='#ffffff')
-        elif self.action == "RELEASE":
-            self.canvas.create_rectangle(2, h-18, w-2, h-2, fill='#aa0000', outline='')
-            self.canvas.create_text(w//2, h-10, text="REL", font=('Arial', 8, 'bold'), fill='#ffffff')
+        # Fish marker (green line)
+        if fish_y is not None and is_active:
+            self.canvas.coords(self.fish_line_id, 0, fish_y, w, fish_y)
+            self.canvas.coords(self.fish_label_id, w-3, fish_y+10)
+            self.canvas.itemconfigure("fish", state='normal')
+        else:
+            self.canvas.itemconfigure("fish", state='hidden')
 
-        self.root.after(33, self._draw)
+        # Action indicator at bottom
+        if action == "HOLD":
+            self.canvas.itemconfigure(self.action_rect_id, fill='#00aa00')
+            self.canvas.itemconfigure(self.action_text_id, text="HOLD")
+            self.canvas.itemconfigure("action", state='normal')
+        elif action == "RELEASE":
+            self.canvas.itemconfigure(self.action_rect_id, fill='#aa0000')
+            self.canvas.itemconfigure(self.action_text_id, text="REL")
+            self.canvas.itemconfigure("action", state='normal')
+        else:
+            self.canvas.itemconfigure("action", state='hidden')
 
     def update(self, fish_y=None, sweet_y=None, is_active=False, status="OFF", action=None):
-        """Update overlay state."""
-        self.fish_y = fish_y
-        self.sweet_y = sweet_y
-        self.is_active = is_active
+        """Update overlay state (picked up by the next pump)."""
         self.status = status
-        self.action = action
+        self.state = (fish_y, sweet_y, is_active, action)
 
     def close(self):
         """Close overlay."""
-        self.running = False
+        if self.root is not None:
+            self.root.destroy()
+            self.root = None
@@ -10,23 +10,27 @@ This tool will:
 """
 
 import cv2
-import numpy as np
 import mss
 import mss.tools
+from screen_capture import screenshot_to_bgr
 
 # Global variables for mouse callback
 current_pos = (0, 0)
 click_points = []
+needs_redraw = True  # Set when the preview has to be redrawn (mouse moved, click, reset)
 
 
 def mouse_callback(event, x, y, flags, param):
     """Handle mouse events on the preview window."""
-    global current_pos, click_points
+    global current_pos, click_points, needs_redraw
 
-    current_pos = (x, y)
+    if (x, y) != current_pos:
+        current_pos = (x, y)
+        needs_redraw = True
 
     if event == cv2.EVENT_LBUTTONDOWN:
         click_points.append((x, y))
+        needs_redraw = True
         print(f"Point {len(click_points)}: ({x}, {y})")
 
         if len(click_points) == 2:
@@ -59,7 +63,7 @@ CAPTURE_REGION = {{
 
 def main():
     """Main function to run the region selector."""
-    global click_points
+    global click_points, needs_redraw
 
     print("")
     print("=" * 50)
@@ -80,10 +84,7 @@ def main():
     with mss.mss() as sct:
         monitor = sct.monitors[1]  # Primary monitor
         screenshot = sct.grab(monitor)
-        img = np.array(screenshot)
-        img = img[:, :, :3]  # Remove alpha channel
-        # Convert from BGR to RGB for display
-        img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        img = screenshot_to_bgr(screenshot)  # Remove alpha channel
 
     print(f"Screenshot size: {img.shape[1]}x{img.shape[0]}")
     print("")
@@ -99,39 +100,44 @@ def main():
         scale = 1920 / img.shape[1]
 
     while True:
-        # Create display image
-        display = img.copy()
+        # Only redraw when something changed - copying and drawing over the
+        # full screenshot is the expensive part, waitKey just polls events
+        if needs_redraw:
+            needs_redraw = False
 
-        # Draw click points
-        for i, point in enumerate(click_points):
-            cv2.circle(display, point, 5, (0, 255, 0), -1)
-            cv2.putText(display, f"P{i+1}", (point[0]+10, point[1]),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+            # Create display image
+            display = img.copy()
 
-        # Draw rectangle if we have 2 points
-        if len(click_points) == 2:
-            cv2.rectangle(display, click_points[0], click_points[1], (0, 255, 0), 2)
+            # Draw click points
+            for i, point in enumerate(click_points):
+                cv2.circle(display, point, 5, (0, 255, 0), -1)
+                cv2.putText(display, f"P{i+1}", (point[0]+10, point[1]),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+
+            # Draw rectangle if we have 2 points
+            if len(click_points) == 2:
+                cv2.rectangle(display, click_points[0], click_points[1], (0, 255, 0), 2)
 
-        # Draw crosshair at current position
-        cv2.line(display, (current_pos[0]-20, current_pos[1]),
-                (current_pos[0]+20, current_pos[1]), (0, 0, 255), 1)
-        cv2.line(display, (current_pos[0], current_pos[1]-20),
-                (current_pos[0], current_pos[1]+20), (0, 0, 255), 1)
+            # Draw crosshair at current position
+            cv2.line(display, (current_pos[0]-20, current_pos[1]),
+                    (current_pos[0]+20, current_pos[1]), (0, 0, 255), 1)
+            cv2.line(display, (current_pos[0], current_pos[1]-20),
+                    (current_pos[0], current_pos[1]+20), (0, 0, 255), 1)
 
-        # Show coordinates
-        coord_text = f"({current_pos[0]}, {current_pos[1]})"
-        cv2.putText(display, coord_text, (current_pos[0]+10, current_pos[1]-10),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
+            # Show coordinates
+            coord_text = f"({current_pos[0]}, {current_pos[1]})"
+            cv2.putText(display, coord_text, (current_pos[0]+10, current_pos[1]-10),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
 
-        # Instructions
-        cv2.putText(display, "Click corners of fishing bars | R=Reset | Q=Quit",
-                   (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            # Instructions
+            cv2.putText(display, "Click corners of fishing bars | R=Reset | Q=Quit",
+                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
 
-        # Resize for display
-        if scale != 1.0:
-            display = cv2.resize(display, None, fx=scale, fy=scale)
+            # Resize for display
+            if scale != 1.0:
+                display = cv2.resize(display, None, fx=scale, fy=scale)
 
-        cv2.imshow(window_name, display)
+            cv2.imshow(window_name, display)
 
         # Handle key presses
         key = cv2.waitKey(1) & 0xFF
@@ -139,6 +145,7 @@ def main():
             break
         elif key == ord('r'):
             click_points = []
+            needs_redraw = True
             print("\nSelection reset. Click two corners again.")
 
     cv2.destroyAllWindows()
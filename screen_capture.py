@@ -2,14 +2,45 @@
 GPO Fishing Macro - Screen Capture Module
 ==========================================
 Handles fast screen capture of the fishing UI region.
-Uses the 'mss' library for high-performance screen grabs.
+Uses the 'mss' library for high-performance screen grabs, or 'dxcam'
+(DXGI Desktop Duplication) on Windows when it's installed.
 """
 
+import sys
+import threading
+import time
+import cv2
 import numpy as np
 import mss
 import mss.tools
 from config import CAPTURE_REGION
 
+try:
+    import dxcam  # Optional - much faster region grabs on Windows
+except ImportError:
+    dxcam = None
+
+
+def screenshot_to_bgr(screenshot):
+    """
+    Convert an mss screenshot to a contiguous BGR numpy array.
+
+    Args:
+        screenshot: mss ScreenShot (raw BGRA pixels)
+
+    Returns:
+        numpy.ndarray: Image in BGR format, shape (height, width, 3)
+    """
+    # View the raw BGRA bytes mss already holds - no copy
+    bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+        screenshot.height, screenshot.width, 4
+    )
+
+    # Drop the alpha channel in one pass into a contiguous BGR array.
+    # np.array(screenshot)[:, :, :3] copies the whole grab first and then
+    # leaves a strided view that OpenCV copies again on every inRange call.
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+
 
 class ScreenCapture:
     """
@@ -18,6 +49,10 @@ class ScreenCapture:
     Usage:
         capture = ScreenCapture()
         image = capture.grab()  # Returns numpy array (BGR format)
+
+    Streaming usage (frames grabbed in a background thread):
+        capture.start_stream(interval=0.008)
+        frame, version = capture.grab_latest(version)
     """
 
     def __init__(self, region=None):
@@ -42,6 +77,28 @@ class ScreenCapture:
             "height": self.region["height"],
         }
 
+        # On Windows use dxcam for region grabs when it's installed - it
+        # reads the composited desktop straight from DXGI instead of going
+        # through GDI like mss. Region coordinates are relative to the
+        # primary monitor. mss stays the fallback everywhere else
+        self.camera = None
+        self.camera_region = self._camera_region()
+        self.last_camera_frame = None
+        if dxcam is not None and sys.platform == "win32":
+            try:
+                self.camera = dxcam.create(output_color="BGR")
+            except Exception as e:
+                print(f"[Capture] dxcam unavailable ({e}), using mss")
+            self._check_camera_region()
+
+        # Background stream state (see start_stream)
+        self._stream_thread = None
+        self._streaming = False
+        self._frame_ready = threading.Condition()
+        self._latest_frame = None
+        self._stream_error = None  # Exception that stopped the stream, raised by grab_latest
+        self.frame_version = 0  # Increments every time the stream publishes a frame
+
     def grab(self):
         """
         Capture the screen region and return as numpy array.
@@ -51,16 +108,72 @@ class ScreenCapture:
                           Shape: (height, width, 3)
         """
         # Grab the screen region
-        screenshot = self.sct.grab(self.monitor)
+        return self._grab_region(self.sct)
+
+    def _grab_region(self, sct):
+        """
+        Grab the capture region with dxcam if available, otherwise mss.
+
+        Args:
+            sct: mss instance to use (mss handles are per thread)
+
+        Returns:
+            numpy.ndarray: Image in BGR format
+        """
+        camera = self.camera  # May be dropped by another thread meanwhile
+        if camera is not None:
+            try:
+                frame = camera.grab(region=self.camera_region)
+            except Exception as e:
+                # Output changed, DXGI access lost, ... - mss still works
+                self._drop_camera(f"dxcam grab failed ({e})")
+                return self._to_bgr(sct.grab(self.monitor))
+            if frame is None:
+                # dxcam returns None when the screen hasn't changed since the
+                # last grab - hand back that frame again
+                frame = self.last_camera_frame
+            else:
+                # Older dxcam versions hand back the region as a strided
+                # slice of the whole desktop - make it contiguous once here
+                # so every inRange on it doesn't copy it again
+                frame = np.ascontiguousarray(frame)
+            if frame is not None:
+                self.last_camera_frame = frame
+                return frame
+
+        return self._to_bgr(sct.grab(self.monitor))
+
+    def _check_camera_region(self):
+        """Fall back to mss if the capture region isn't on dxcam's output."""
+        if self.camera is None:
+            return
+
+        # dxcam only captures the primary monitor and rejects any region
+        # that sticks out of it (secondary monitor, negative coordinates)
+        left, top, right, bottom = self.camera_region
+        if not (0 <= left < right <= self.camera.width and 0 <= top < bottom <= self.camera.height):
+            self._drop_camera("capture region is outside the primary monitor")
 
-        # Convert to numpy array
-        # mss returns BGRA format, we need BGR for OpenCV
-        img = np.array(screenshot)
+    def _drop_camera(self, reason):
+        """Stop using dxcam and grab with mss from now on."""
+        camera = self.camera
+        self.camera = None
+        self.last_camera_frame = None
+        print(f"[Capture] {reason}, using mss")
+        try:
+            camera.release()
+        except Exception:
+            pass
 
-        # Remove alpha channel (BGRA -> BGR)
-        img = img[:, :, :3]
+    def _camera_region(self):
+        """Capture region as a dxcam (left, top, right, bottom) tuple."""
+        left = self.monitor["left"]
+        top = self.monitor["top"]
+        return (left, top, left + self.monitor["width"], top + self.monitor["height"])
 
-        return img
+    def _to_bgr(self, screenshot):
+        """Convert an mss screenshot to a BGR numpy array."""
+        return screenshot_to_bgr(screenshot)
 
     def grab_full_screen(self):
         """
@@ -73,9 +186,7 @@ class ScreenCapture:
         # Monitor 1 is the primary display (0 is "all monitors combined")
         monitor = self.sct.monitors[1]
         screenshot = self.sct.grab(monitor)
-        img = np.array(screenshot)
-        img = img[:, :, :3]
-        return img
+        return self._to_bgr(screenshot)
 
     def update_region(self, left, top, width, height):
         """
@@ -94,16 +205,101 @@ class ScreenCapture:
             "height": height,
         }
         self.monitor = self.region.copy()
+        self.camera_region = self._camera_region()
+        self.last_camera_frame = None
+        self._check_camera_region()
+
+    def start_stream(self, interval=0.0):
+        """
+        Start grabbing frames continuously in a background thread.
+        The control loop then reads the newest frame with grab_latest()
+        instead of waiting on a screen grab every tick.
+
+        Args:
+            interval: Minimum time between grabs (seconds)
+        """
+        if self._stream_thread is not None:
+            return
+
+        self._streaming = True
+        self._stream_error = None
+        self._stream_thread = threading.Thread(target=self._stream_loop, args=(interval,), daemon=True)
+        self._stream_thread.start()
+
+    def stop_stream(self):
+        """Stop the background grab thread (if running)."""
+        if self._stream_thread is None:
+            return
+
+        self._streaming = False
+        self._stream_thread.join()
+        self._stream_thread = None
+
+    def _stream_loop(self, interval):
+        """Grab frames until stopped, publishing each one as the latest frame."""
+        try:
+            # mss handles are tied to the thread that created them,
+            # so the stream thread needs its own instance
+            with mss.mss() as sct:
+                # Pace grabs against fixed deadlines so sleep overshoot doesn't
+                # accumulate and the frame rate stays steady
+                next_time = time.perf_counter()
+                while self._streaming:
+                    frame = self._grab_region(sct)
+
+                    with self._frame_ready:
+                        self._latest_frame = frame
+                        self.frame_version += 1
+                        self._frame_ready.notify_all()
+
+                    next_time += interval
+                    remaining = next_time - time.perf_counter()
+                    if remaining > 0:
+                        time.sleep(remaining)
+                    else:
+                        # Fell behind (slow grab) - start over from now instead
+                        # of firing a burst of back-to-back grabs to catch up
+                        next_time = time.perf_counter()
+        except Exception as e:
+            # Don't die silently - hand the error to the reader, which raises
+            # it from grab_latest just like a failed grab() would
+            print(f"[Capture] Stream stopped: {e}")
+            with self._frame_ready:
+                self._stream_error = e
+                self._frame_ready.notify_all()
+
+    def grab_latest(self, last_version=0, timeout=0.1):
+        """
+        Get the newest streamed frame, waiting for one newer than last_version.
+
+        Args:
+            last_version: Version of the last frame the caller processed
+            timeout: Max time to wait for a new frame (seconds)
+
+        Returns:
+            tuple: (frame, version) - frame is None if no new frame arrived in time
+
+        Raises:
+            Exception: Whatever stopped the stream thread, if it failed
+        """
+        with self._frame_ready:
+            if not self._frame_ready.wait_for(
+                    lambda: self.frame_version != last_version or self._stream_error is not None, timeout):
+                return None, last_version
+            if self._stream_error is not None:
+                raise self._stream_error
+            return self._latest_frame, self.frame_version
 
     def close(self):
         """Clean up resources."""
+        self.stop_stream()
         self.sct.close()
+        if self.camera is not None:
+            self.camera.release()
 
 
 # Quick test if run directly
 if __name__ == "__main__":
-    import cv2
-
     print("Testing screen capture...")
     print(f"Capture region: {CAPTURE_REGION}")
 
@@ -8,11 +8,19 @@ Press Q to quit.
 
 import cv2
 import numpy as np
-import mss
 from config import (
     BLUE_BAR_COLOR,
     CAPTURE_REGION,
+    DETECTION_ROW_STEP,
+    LOOP_DELAY,
 )
+from detector import largest_sweet_spot_segment
+from screen_capture import ScreenCapture
+
+# Color bounds as uint8 arrays, built once at import so the per-frame
+# cv2.inRange calls don't allocate fresh arrays every frame
+_BLUE_LOWER = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
+_BLUE_UPPER = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
 
 
 def main():
@@ -31,8 +39,6 @@ def main():
     print("Press Q to quit")
     print("=" * 50)
 
-    sct = mss.mss()
-
     # Create window
     cv2.namedWindow("Sweet Spot Debug", cv2.WINDOW_NORMAL)
     cv2.resizeWindow("Sweet Spot Debug", 900, 600)
@@ -45,57 +51,88 @@ def main():
         "height": CAPTURE_REGION["height"],
     }
 
-    while True:
-        # Capture the region
-        screenshot = sct.grab(region)
-        frame = np.array(screenshot)[:, :, :3]  # Remove alpha
+    # Display layout
+    height = region["height"]
+    width = region["width"]
+    scale = 4  # Scale up the frame for better visibility
+    graph_width = 200
+    info_height = 80
+
+    # Detection scans every Nth row, same as the detector - positions are
+    # full-frame Y values and the panels stretch the rows back out
+    step = DETECTION_ROW_STEP
+    scanned_rows = (height + step - 1) // step
+
+    # Allocate every buffer once. The panels are views into the final
+    # display image, so resizing/drawing into a panel writes straight into
+    # the window image - no per-frame allocations or hstack/vstack copies
+    final_display = np.zeros((info_height + height, width * scale * 2 + graph_width, 3), dtype=np.uint8)
+    info_panel = final_display[:info_height]
+    frame_large = final_display[info_height:, :width * scale]
+    mask_bgr = final_display[info_height:, width * scale:width * scale * 2]
+    graph = final_display[info_height:, width * scale * 2:]
+
+    blue_mask = np.empty((scanned_rows, width), dtype=np.uint8)
+    mask_large = np.empty((height, width * scale), dtype=np.uint8)
+
+    # Graph bars span x = 0..bar_width inclusive (like cv2.line), so each
+    # row's bar is a mask over these column indices. The bars are painted
+    # by copying from solid color images through that mask
+    bar_max = graph_width - 10
+    bar_xs = np.arange(bar_max + 1, dtype=np.int32)
+    sweet_row_fill = np.empty((height, bar_max + 1, 3), dtype=np.uint8)
+    sweet_row_fill[:] = (0, 255, 0)  # Green = sweet spot row
+    bar_row_fill = np.empty((height, bar_max + 1, 3), dtype=np.uint8)
+    bar_row_fill[:] = (255, 100, 0)  # Blue = not sweet spot
+
+    # Grab frames on a background thread so capture keeps going while this
+    # loop is busy drawing - each pass shows the newest frame
+    capture = ScreenCapture(region)
+    capture.start_stream(LOOP_DELAY)
+    frame_version = 0
+    last_frame = None
 
-        height, width = frame.shape[:2]
+    while True:
+        frame, frame_version = capture.grab_latest(frame_version)
+        if frame is None or (last_frame is not None
+                             and cv2.norm(frame, last_frame, cv2.NORM_INF) == 0):
+            # No new frame yet, or it's pixel-identical to the one on screen
+            # (static UI) - nothing to redraw, just keep the window responsive
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+            continue
+        last_frame = frame
 
         # === DETECT BLUE BARS ===
-        lower_blue = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
-        upper_blue = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
-        blue_mask = cv2.inRange(frame, lower_blue, upper_blue)
+        cv2.inRange(frame[::step], _BLUE_LOWER, _BLUE_UPPER, dst=blue_mask)
 
-        # Count blue pixels per row
-        blue_per_row = np.sum(blue_mask > 0, axis=1)
-        max_blue = np.max(blue_per_row) if np.max(blue_per_row) > 0 else 1
+        # Count blue pixels per row - mask values are 0/255, so sum each row
+        # in one OpenCV pass and scale down instead of building a bool array
+        blue_per_row = cv2.reduce(blue_mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
+        max_blue = int(blue_per_row.max(initial=1))
         threshold = max_blue * 0.2
 
-        # Find rows with LOW blue count = sweet spot area
-        sweet_spot_rows = np.where(blue_per_row < threshold)[0]
-
-        sweet_y = None
-        largest_segment = None
+        # Rows with LOW blue count = sweet spot area - same search as the
+        # detector, the largest run of them is the sweet spot
+        largest_segment = largest_sweet_spot_segment(blue_per_row, threshold, step)
 
-        if len(sweet_spot_rows) > 0:
-            # Find continuous segments
-            gaps = np.diff(sweet_spot_rows)
-            segment_breaks = np.where(gaps > 5)[0]
-
-            if len(segment_breaks) == 0:
-                # One continuous segment
-                sweet_y = int(np.mean(sweet_spot_rows))
-                largest_segment = sweet_spot_rows
-            else:
-                # Multiple segments - find the largest one
-                segments = np.split(sweet_spot_rows, segment_breaks + 1)
-                largest_segment = max(segments, key=len)
-                sweet_y = int(np.mean(largest_segment))
+        if len(largest_segment) > 0:
+            sweet_y = int(largest_segment.sum()) // len(largest_segment)
+        else:
+            sweet_y = None
+            largest_segment = None
 
         # === CREATE VISUALIZATION ===
 
         # Scale up the frame for better visibility
-        scale = 4
-        frame_large = cv2.resize(frame, (width * scale, height), interpolation=cv2.INTER_NEAREST)
-        mask_large = cv2.resize(blue_mask, (width * scale, height), interpolation=cv2.INTER_NEAREST)
+        cv2.resize(frame, (width * scale, height), dst=frame_large, interpolation=cv2.INTER_NEAREST)
+        cv2.resize(blue_mask, (width * scale, height), dst=mask_large, interpolation=cv2.INTER_NEAREST)
 
         # Convert mask to BGR for display
-        mask_bgr = cv2.cvtColor(mask_large, cv2.COLOR_GRAY2BGR)
+        cv2.cvtColor(mask_large, cv2.COLOR_GRAY2BGR, dst=mask_bgr)
 
-        # Create graph showing blue pixels per row
-        graph_width = 200
-        graph = np.zeros((height, graph_width, 3), dtype=np.uint8)
+        # Graph showing blue pixels per row
+        graph[:] = 0
 
         # Draw background grid
         for i in range(0, graph_width, 20):
@@ -107,18 +144,19 @@ def main():
         threshold_x = int((threshold / max(max_blue, 1)) * (graph_width - 10))
         cv2.line(graph, (threshold_x, 0), (threshold_x, height), (0, 100, 100), 1)
 
-        # Draw blue count per row as horizontal bars
-        for y in range(height):
-            bar_width = int((blue_per_row[y] / max(max_blue, 1)) * (graph_width - 10))
-
-            # Color based on whether this row is part of sweet spot
-            if blue_per_row[y] < threshold:
-                color = (0, 255, 0)  # Green = sweet spot row
-            else:
-                color = (255, 100, 0)  # Blue = not sweet spot
+        # Draw blue count per row as horizontal bars - masked copies over
+        # all rows at once instead of a cv2.line call per row. Each scanned
+        # row's bar covers the display rows it stands for
+        display_per_row = np.repeat(blue_per_row, step)[:height]
+        bar_widths = (display_per_row / max(max_blue, 1) * bar_max).astype(np.int32)
+        bar_widths[bar_widths <= 0] = -1  # Empty rows get no bar at all
+        bar_mask = bar_xs <= bar_widths[:, None]
+        bars = graph[:, :bar_max + 1]
+        cv2.copyTo(bar_row_fill, bar_mask.view(np.uint8), bars)
 
-            if bar_width > 0:
-                cv2.line(graph, (0, y), (bar_width, y), color, 1)
+        # Recolor the rows that are part of the sweet spot
+        bar_mask[display_per_row >= threshold] = False
+        cv2.copyTo(sweet_row_fill, bar_mask.view(np.uint8), bars)
 
         # Draw sweet spot position on all panels
         if sweet_y is not None:
@@ -141,12 +179,8 @@ def main():
                     cv2.circle(frame_large, (x, seg_top), 1, (0, 200, 200), -1)
                     cv2.circle(frame_large, (x, seg_bot), 1, (0, 200, 200), -1)
 
-        # Combine all panels
-        display = np.hstack([frame_large, mask_bgr, graph])
-
-        # Add info panel at top
-        info_height = 80
-        info_panel = np.zeros((info_height, display.shape[1], 3), dtype=np.uint8)
+        # Info panel at top
+        info_panel[:] = 0
 
         # Info text
         cv2.putText(info_panel, "SWEET SPOT DEBUGGER", (10, 25),
@@ -159,7 +193,7 @@ def main():
             cv2.putText(info_panel, f"Sweet Spot Y: {sweet_y}", (10, 70),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
             if largest_segment is not None:
-                seg_size = len(largest_segment)
+                seg_size = len(largest_segment) * step
                 cv2.putText(info_panel, f"Segment size: {seg_size}px", (200, 70),
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
         else:
@@ -182,15 +216,12 @@ def main():
         cv2.putText(info_panel, "BLUE/ROW", (col3_x, 25),
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
 
-        # Combine with info panel
-        final_display = np.vstack([info_panel, display])
-
         cv2.imshow("Sweet Spot Debug", final_display)
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
-    sct.close()
+    capture.close()
     cv2.destroyAllWindows()
     print("Sweet spot debugger closed.")
 
@@ -13,7 +13,24 @@ from config import (
     FISH_MARKER_GREEN,
     BLUE_BAR_COLOR,
     CAPTURE_REGION,
+    DETECTION_ROW_STEP,
+    LOOP_DELAY,
 )
+from detector import largest_sweet_spot_segment, mask_row_centroid
+from screen_capture import ScreenCapture, screenshot_to_bgr
+
+# Color bounds as uint8 arrays, built once at import so the per-frame
+# cv2.inRange calls don't allocate fresh arrays every frame
+_WHITE_LOWER = np.array(FISH_MARKER_WHITE["lower"], dtype=np.uint8)
+_WHITE_UPPER = np.array(FISH_MARKER_WHITE["upper"], dtype=np.uint8)
+_GREEN_LOWER = np.array(FISH_MARKER_GREEN["lower"], dtype=np.uint8)
+_GREEN_UPPER = np.array(FISH_MARKER_GREEN["upper"], dtype=np.uint8)
+_BLUE_LOWER = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
+_BLUE_UPPER = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
+
+# Only the capture region is grabbed every frame - the rest of the screen
+# is just backdrop, so the full-screen grab is refreshed every N frames
+FULL_SCREEN_REFRESH_FRAMES = 10
 
 
 def main():
@@ -42,79 +59,124 @@ def main():
     region_width = CAPTURE_REGION["width"]
     region_height = CAPTURE_REGION["height"]
 
-    while True:
-        # Capture full screen
-        screenshot = sct.grab(monitor)
-        full_frame = np.array(screenshot)[:, :, :3]  # Remove alpha
+    # Region relative to the primary monitor, as an mss grab area
+    region_monitor = {
+        "left": monitor["left"] + region_left,
+        "top": monitor["top"] + region_top,
+        "width": region_width,
+        "height": region_height,
+    }
+
+    # Info box never changes - render it once as a patch that's pasted
+    # over the display every frame. It covers (10, 10) - (350, 100)
+    info_box = np.zeros((91, 341, 3), dtype=np.uint8)
+    cv2.putText(info_box, "VISUAL DEBUGGER", (10, 25),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    cv2.putText(info_box, "YELLOW box = capture region", (10, 45),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+    cv2.putText(info_box, "CYAN = detected blue bars", (10, 65),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+    cv2.putText(info_box, "Press Q to quit", (10, 85),
+               cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+
+    # Detection scans every Nth row, same as the detector
+    step = DETECTION_ROW_STEP
+
+    # Fish mask buffers, allocated once and filled in place every frame
+    scanned_rows = (region_height + step - 1) // step
+    fish_mask = np.empty((scanned_rows, region_width), dtype=np.uint8)
+    green_mask = np.empty_like(fish_mask)
+    row_y = np.arange(0, region_height, step)  # Region Y of each scanned row
+
+    # Cyan tint buffers: the blue mask at full region height, and the tint
+    # image built from it (mask in the blue and green channels)
+    region_mask = np.empty((region_height, region_width), dtype=np.uint8)
+    no_tint = np.zeros_like(region_mask)
+    blue_overlay = np.empty((region_height, region_width, 3), dtype=np.uint8)
+
+    # Grab the region on a background thread so capture keeps going while
+    # this loop is busy drawing - each pass shows the newest frame
+    capture = ScreenCapture(region_monitor)
+    capture.start_stream(LOOP_DELAY)
+    frame_version = 0
+
+    full_frame = None
+    last_region_frame = None
+    frame_count = 0
 
-        # Extract the capture region
-        region_frame = full_frame[
-            region_top:region_top + region_height,
-            region_left:region_left + region_width
-        ]
+    while True:
+        region_frame, frame_version = capture.grab_latest(frame_version)
+        if region_frame is None:
+            # No new frame yet - keep the window responsive
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+            continue
+
+        # Refresh the full screen backdrop every few frames
+        refresh_backdrop = frame_count % FULL_SCREEN_REFRESH_FRAMES == 0
+        frame_count += 1
+        if refresh_backdrop:
+            screenshot = sct.grab(monitor)
+            full_frame = screenshot_to_bgr(screenshot)  # Remove alpha
+
+            # Draw capture region rectangle (yellow) - part of the backdrop,
+            # so it's only drawn when the backdrop changes
+            cv2.rectangle(full_frame,
+                         (region_left, region_top),
+                         (region_left + region_width, region_top + region_height),
+                         (0, 255, 255), 3)
+        elif cv2.norm(region_frame, last_region_frame, cv2.NORM_INF) == 0:
+            # Region is pixel-identical to the one on screen (static UI)
+            # and the backdrop didn't change - nothing to redraw
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+            continue
+        last_region_frame = region_frame
+
+        scan_frame = region_frame[::step]
 
         # === DETECT BLUE BARS in region ===
-        lower_blue = np.array(BLUE_BAR_COLOR["lower"], dtype=np.uint8)
-        upper_blue = np.array(BLUE_BAR_COLOR["upper"], dtype=np.uint8)
-        blue_mask = cv2.inRange(region_frame, lower_blue, upper_blue)
+        blue_mask = cv2.inRange(scan_frame, _BLUE_LOWER, _BLUE_UPPER)
 
-        # Count blue per row
-        blue_per_row = np.sum(blue_mask > 0, axis=1)
-        max_blue = np.max(blue_per_row) if np.max(blue_per_row) > 0 else 1
+        # Count blue per row (0/255 mask, summed in one OpenCV pass)
+        blue_per_row = cv2.reduce(blue_mask, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
+        max_blue = int(blue_per_row.max(initial=1))
         threshold = max_blue * 0.2
 
-        # Find sweet spot (gap in blue)
-        sweet_spot_rows = np.where(blue_per_row < threshold)[0]
+        # Find sweet spot (largest gap in blue, same search as the detector)
+        largest_segment = largest_sweet_spot_segment(blue_per_row, threshold, step)
 
-        if len(sweet_spot_rows) > 0:
-            gaps = np.diff(sweet_spot_rows)
-            segment_breaks = np.where(gaps > 5)[0]
-
-            if len(segment_breaks) == 0:
-                sweet_y = int(np.mean(sweet_spot_rows))
-            else:
-                segments = np.split(sweet_spot_rows, segment_breaks + 1)
-                largest_segment = max(segments, key=len)
-                sweet_y = int(np.mean(largest_segment))
+        if len(largest_segment) > 0:
+            sweet_y = int(largest_segment.sum()) // len(largest_segment)
         else:
             sweet_y = None
 
         # === DETECT FISH in region (both white and green) ===
-        # White fish (not tracking)
-        lower_white = np.array(FISH_MARKER_WHITE["lower"], dtype=np.uint8)
-        upper_white = np.array(FISH_MARKER_WHITE["upper"], dtype=np.uint8)
-        white_mask = cv2.inRange(region_frame, lower_white, upper_white)
+        # White fish (not tracking), straight into the combined mask
+        cv2.inRange(scan_frame, _WHITE_LOWER, _WHITE_UPPER, dst=fish_mask)
 
         # Green fish (tracking correctly)
-        lower_green = np.array(FISH_MARKER_GREEN["lower"], dtype=np.uint8)
-        upper_green = np.array(FISH_MARKER_GREEN["upper"], dtype=np.uint8)
-        green_mask = cv2.inRange(region_frame, lower_green, upper_green)
+        cv2.inRange(scan_frame, _GREEN_LOWER, _GREEN_UPPER, dst=green_mask)
 
-        # Combine both
-        fish_mask = cv2.bitwise_or(white_mask, green_mask)
+        # Combine both in place
+        cv2.bitwise_or(fish_mask, green_mask, dst=fish_mask)
 
-        coords = cv2.findNonZero(fish_mask)
-        if coords is not None and len(coords) > 5:
-            fish_y = int(np.mean(coords[:, 0, 1]))
-        else:
+        # Centroid Y the same way the detector computes it
+        fish_y, fish_pixels = mask_row_centroid(fish_mask, row_y)
+        if fish_pixels * step <= 5:
             fish_y = None
 
         # === DRAW ON FULL FRAME ===
         display = full_frame.copy()
 
-        # Draw capture region rectangle (yellow)
-        cv2.rectangle(display,
-                     (region_left, region_top),
-                     (region_left + region_width, region_top + region_height),
-                     (0, 255, 255), 3)
-
-        # Draw blue mask overlay inside region (cyan tint)
-        blue_overlay = np.zeros_like(region_frame)
-        blue_overlay[:, :, 0] = blue_mask  # Blue
-        blue_overlay[:, :, 1] = blue_mask  # Green
-        region_with_overlay = cv2.addWeighted(region_frame, 1.0, blue_overlay, 0.4, 0)
-        display[region_top:region_top + region_height,
-                region_left:region_left + region_width] = region_with_overlay
+        # Draw blue mask overlay inside region (cyan tint), with the
+        # scanned rows stretched back to the full region height. The blend
+        # is written straight into the region of the display
+        cv2.resize(blue_mask, (region_width, region_height), dst=region_mask, interpolation=cv2.INTER_NEAREST)
+        cv2.merge((region_mask, region_mask, no_tint), dst=blue_overlay)  # Blue + Green
+        cv2.addWeighted(region_frame, 1.0, blue_overlay, 0.4, 0,
+                        dst=display[region_top:region_top + region_height,
+                                    region_left:region_left + region_width])
 
         # Draw fish position (red line) - full width across region
         if fish_y is not None:
@@ -151,21 +213,14 @@ def main():
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, action_color, 2)
 
         # Info box at top
-        cv2.rectangle(display, (10, 10), (350, 100), (0, 0, 0), -1)
-        cv2.putText(display, "VISUAL DEBUGGER", (20, 35),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        cv2.putText(display, "YELLOW box = capture region", (20, 55),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
-        cv2.putText(display, "CYAN = detected blue bars", (20, 75),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
-        cv2.putText(display, "Press Q to quit", (20, 95),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+        display[10:101, 10:351] = info_box
 
         cv2.imshow("Debug View - Full Screen", display)
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
+    capture.close()
     sct.close()
     cv2.destroyAllWindows()
     print("Debug view closed.")